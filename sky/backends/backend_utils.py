@@ -108,6 +108,13 @@ CLUSTER_FILE_MOUNTS_LOCK_PATH = os.path.expanduser(
     '~/.sky/.{}_file_mounts.lock')
 CLUSTER_FILE_MOUNTS_LOCK_TIMEOUT_SECONDS = 10
 
+# Within this duration after a controller was verified to be accessible,
+# is_controller_accessible() trusts the locally cached UP status instead of
+# refreshing the controller status again.
+_CONTROLLER_ACCESSIBLE_CACHE_SECONDS = 30
+# Controller cluster name -> time.monotonic() of the last successful check.
+_controller_last_accessible_time: Dict[str, float] = {}
+
 # Remote dir that holds our runtime files.
 _REMOTE_RUNTIME_FILES_DIR = '~/.sky/.runtime_files'
 
@@ -2329,6 +2336,22 @@ def is_controller_accessible(
     if non_existent_message is None:
         non_existent_message = controller.value.default_hint_if_non_existent
     cluster_name = controller.value.cluster_name
+
+    # Skip the (costly) status refresh if the controller was verified to be
+    # accessible recently. We still read the local cluster table, so that a
+    # controller stopped, terminated or relaunched by this process is not
+    # served from the cache.
+    last_accessible_time = _controller_last_accessible_time.get(cluster_name)
+    if (last_accessible_time is not None and
+            time.monotonic() - last_accessible_time <
+            _CONTROLLER_ACCESSIBLE_CACHE_SECONDS):
+        record = global_user_state.get_cluster_from_name(cluster_name)
+        if (record is not None and
+                record['status'] == status_lib.ClusterStatus.UP and
+                record['handle'] is not None and
+                record['handle'].head_ip is not None):
+            return record['handle']
+
     need_connection_check = False
     controller_status, handle = None, None
     try:
@@ -2404,6 +2427,7 @@ def is_controller_accessible(
         assert controller_status == status_lib.ClusterStatus.UP, handle
 
     if error_msg is not None:
+        _controller_last_accessible_time.pop(cluster_name, None)
         if exit_if_not_accessible:
             sky_logging.print(error_msg)
             sys.exit(1)
@@ -2413,6 +2437,8 @@ def is_controller_accessible(
                                                handle=handle)
     assert handle is not None and handle.head_ip is not None, (
         handle, controller_status)
+    if controller_status == status_lib.ClusterStatus.UP:
+        _controller_last_accessible_time[cluster_name] = time.monotonic()
     return handle
 
 
@@ -1,4 +1,5 @@
 """SkyServe core APIs."""
+import os
 import re
 import tempfile
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -16,6 +17,7 @@ from sky.serve import constants as serve_constants
 from sky.serve import serve_state
 from sky.serve import serve_utils
 from sky.skylet import constants
+from sky.skylet import job_lib
 from sky.usage import usage_lib
 from sky.utils import admin_policy_utils
 from sky.utils import common_utils
@@ -27,6 +29,8 @@ from sky.utils import ux_utils
 
 logger = sky_logging.init_logger(__name__)
 
+_SERVICE_NAME_RE = re.compile(constants.CLUSTER_NAME_VALID_REGEX)
+
 
 def _validate_service_task(task: 'sky.Task') -> None:
     """Validate the task for Sky Serve.
@@ -38,49 +42,42 @@ def _validate_service_task(task: 'sky.Task') -> None:
         ValueError: if the arguments are invalid.
         RuntimeError: if the task.serve is not found.
     """
-    spot_resources: List['sky.Resources'] = [
-        resource for resource in task.resources if resource.use_spot
-    ]
-    # TODO(MaoZiming): Allow mixed on-demand and spot specification in resources
-    # On-demand fallback should go to the resources specified as on-demand.
-    if len(spot_resources) not in [0, len(task.resources)]:
-        with ux_utils.print_exception_no_traceback():
-            raise ValueError(
-                'Resources must either all use spot or none use spot. '
-                'To use on-demand and spot instances together, '
-                'use `dynamic_ondemand_fallback` or set '
-                'base_ondemand_fallback_replicas.')
-
     if task.service is None:
         with ux_utils.print_exception_no_traceback():
             raise RuntimeError('Service section not found.')
 
+    use_ondemand_fallback = task.service.use_ondemand_fallback
     policy_description = ('on-demand'
                           if task.service.dynamic_ondemand_fallback else 'spot')
-    for resource in list(task.resources):
-        if resource.job_recovery is not None:
-            with ux_utils.print_exception_no_traceback():
-                raise ValueError('job_recovery is disabled for SkyServe. '
-                                 'SkyServe will replenish preempted spot '
-                                 f'with {policy_description} instances.')
-
+    num_spot_resources = 0
     replica_ingress_port: Optional[int] = None
     for requested_resources in task.resources:
-        if (task.service.use_ondemand_fallback and
-                not requested_resources.use_spot):
+        if requested_resources.use_spot:
+            num_spot_resources += 1
+        elif use_ondemand_fallback:
             with ux_utils.print_exception_no_traceback():
                 raise ValueError(
                     '`use_ondemand_fallback` is only supported '
                     'for spot resources. Please explicitly specify '
                     '`use_spot: true` in resources for on-demand fallback.')
-        requested_ports = list(
-            resources_utils.port_ranges_to_set(requested_resources.ports))
-        if len(requested_ports) != 1:
+        if requested_resources.job_recovery is not None:
             with ux_utils.print_exception_no_traceback():
-                raise ValueError(
-                    'Must only specify one port in resources. Each replica '
-                    'will use the port specified as application ingress port.')
-        service_port = requested_ports[0]
+                raise ValueError('job_recovery is disabled for SkyServe. '
+                                 'SkyServe will replenish preempted spot '
+                                 f'with {policy_description} instances.')
+        ports = requested_resources.ports
+        if ports is not None and len(ports) == 1 and ports[0].isdigit():
+            # Fast path for the common case of a single port, e.g. ['8080'].
+            service_port = int(ports[0])
+        else:
+            requested_ports = list(resources_utils.port_ranges_to_set(ports))
+            if len(requested_ports) != 1:
+                with ux_utils.print_exception_no_traceback():
+                    raise ValueError(
+                        'Must only specify one port in resources. Each replica '
+                        'will use the port specified as application ingress '
+                        'port.')
+            service_port = requested_ports[0]
         if replica_ingress_port is None:
             replica_ingress_port = service_port
         elif service_port != replica_ingress_port:
@@ -90,6 +87,16 @@ def _validate_service_task(task: 'sky.Task') -> None:
                     f'{replica_ingress_port} in different resources. '
                     'Please specify the same port instead.')
 
+    # TODO(MaoZiming): Allow mixed on-demand and spot specification in resources
+    # On-demand fallback should go to the resources specified as on-demand.
+    if num_spot_resources not in [0, len(task.resources)]:
+        with ux_utils.print_exception_no_traceback():
+            raise ValueError(
+                'Resources must either all use spot or none use spot. '
+                'To use on-demand and spot instances together, '
+                'use `dynamic_ondemand_fallback` or set '
+                'base_ondemand_fallback_replicas.')
+
 
 @usage_lib.entrypoint
 def up(
@@ -116,7 +123,7 @@ def up(
     # 1. controller cluster name: 'sky-serve-controller-<service_name>'
     # 2. replica cluster name: '<service_name>-<replica_id>'
     # In both cases, service name shares the same regex with cluster name.
-    if re.fullmatch(constants.CLUSTER_NAME_VALID_REGEX, service_name) is None:
+    if _SERVICE_NAME_RE.fullmatch(service_name) is None:
         with ux_utils.print_exception_no_traceback():
             raise ValueError(f'Service name {service_name!r} is invalid: '
                              f'ensure it is fully matched by regex (e.g., '
@@ -132,13 +139,13 @@ def up(
     controller_utils.maybe_translate_local_file_mounts_and_sync_up(task,
                                                                    path='serve')
 
+    # Only the service task YAML needs to be materialized on disk, as it is
+    # uploaded to the controller. The controller task is built directly from
+    # the rendered template.
     with tempfile.NamedTemporaryFile(
             prefix=f'service-task-{service_name}-',
             mode='w',
-    ) as service_file, tempfile.NamedTemporaryFile(
-            prefix=f'controller-task-{service_name}-',
-            mode='w',
-    ) as controller_file:
+    ) as service_file:
         controller_name = serve_utils.SKY_SERVE_CONTROLLER_NAME
         task_config = task.to_yaml_config()
         common_utils.dump_yaml(service_file.name, task_config)
@@ -166,17 +173,19 @@ def up(
                 local_user_config=mutated_user_config,
             ),
         }
-        common_utils.fill_template(serve_constants.CONTROLLER_TEMPLATE,
-                                   vars_to_fill,
-                                   output_path=controller_file.name)
-        controller_task = task_lib.Task.from_yaml(controller_file.name)
+        controller_task = task_lib.Task.from_yaml_str(
+            common_utils.render_template(serve_constants.CONTROLLER_TEMPLATE,
+                                         vars_to_fill))
         # TODO(tian): Probably run another sky.launch after we get the load
         # balancer port from the controller? So we don't need to open so many
         # ports here. Or, we should have a nginx traffic control to refuse
         # any connection to the unregistered ports.
+        # Resources taken from an existing controller already have the load
+        # balancer ports set, in which case we skip the (validating) copy.
+        load_balancer_ports = [serve_constants.LOAD_BALANCER_PORT_RANGE]
         controller_resources = {
-            r.copy(ports=[serve_constants.LOAD_BALANCER_PORT_RANGE])
-            for r in controller_resources
+            r if r.ports == load_balancer_ports else r.copy(
+                ports=load_balancer_ports) for r in controller_resources
         }
         controller_task.set_resources(controller_resources)
 
@@ -185,8 +194,8 @@ def up(
         # to set it to a smaller value to support a larger number of services.
         controller_task.service_name = service_name
 
-        print(f'{colorama.Fore.YELLOW}Launching controller for '
-              f'{service_name!r}...{colorama.Style.RESET_ALL}')
+        sky_logging.print(f'{colorama.Fore.YELLOW}Launching controller for '
+                          f'{service_name!r}...{colorama.Style.RESET_ALL}')
         # We directly submit the request to the controller and let the
         # controller to check name conflict. Suppose we have multiple
         # sky.serve.up() with same service name, the first one will
@@ -208,9 +217,6 @@ def up(
             _disable_controller_check=True,
         )
 
-        style = colorama.Style
-        fore = colorama.Fore
-
         assert controller_job_id is not None and controller_handle is not None
         # TODO(tian): Cache endpoint locally to speedup. Endpoint won't
         # change after the first time, so there is no consistency issue.
@@ -225,20 +231,28 @@ def up(
             assert isinstance(backend, backends.CloudVmRayBackend)
             assert isinstance(controller_handle,
                               backends.CloudVmRayResourceHandle)
-            returncode, lb_port_payload, _ = backend.run_on_head(
+            returncode, lb_port_payload, stderr = backend.run_on_head(
                 controller_handle,
                 code,
                 require_outputs=True,
-                stream_logs=False)
+                stream_logs=False,
+                separate_stderr=True)
         try:
             subprocess_utils.handle_returncode(
                 returncode, code, 'Failed to wait for service initialization',
-                lb_port_payload)
+                stderr)
         except exceptions.CommandError:
-            statuses = backend.get_job_status(controller_handle,
-                                              [controller_job_id],
-                                              stream_logs=False)
-            controller_job_status = list(statuses.values())[0]
+            try:
+                # On failure, the controller reports the status of the
+                # controller job in the same call.
+                statuses = job_lib.load_statuses_payload(lb_port_payload)
+            except ValueError:
+                # Controllers with an old SkyPilot version do not report the
+                # job status, so we query it separately.
+                statuses = backend.get_job_status(controller_handle,
+                                                  [controller_job_id],
+                                                  stream_logs=False)
+            controller_job_status = next(iter(statuses.values()))
             if controller_job_status == sky.JobStatus.PENDING:
                 # Max number of services reached due to vCPU constraint.
                 # The controller job is pending due to ray job scheduling.
@@ -269,39 +283,32 @@ def up(
                 skip_status_check=True).get(lb_port)
             assert endpoint is not None, 'Did not get endpoint for controller.'
 
-        sky_logging.print(
-            f'{fore.CYAN}Service name: '
-            f'{style.BRIGHT}{service_name}{style.RESET_ALL}'
-            f'\n{fore.CYAN}Endpoint URL: '
-            f'{style.BRIGHT}{endpoint}{style.RESET_ALL}'
-            '\nTo see detailed info:\t\t'
-            f'{backend_utils.BOLD}sky serve status {service_name} '
-            f'[--endpoint]{backend_utils.RESET_BOLD}'
-            '\nTo teardown the service:\t'
-            f'{backend_utils.BOLD}sky serve down {service_name}'
-            f'{backend_utils.RESET_BOLD}'
-            '\n'
-            '\nTo see logs of a replica:\t'
-            f'{backend_utils.BOLD}sky serve logs {service_name} [REPLICA_ID]'
-            f'{backend_utils.RESET_BOLD}'
-            '\nTo see logs of load balancer:\t'
-            f'{backend_utils.BOLD}sky serve logs --load-balancer {service_name}'
-            f'{backend_utils.RESET_BOLD}'
-            '\nTo see logs of controller:\t'
-            f'{backend_utils.BOLD}sky serve logs --controller {service_name}'
-            f'{backend_utils.RESET_BOLD}'
-            '\n'
-            '\nTo monitor replica status:\t'
-            f'{backend_utils.BOLD}watch -n10 sky serve status {service_name}'
-            f'{backend_utils.RESET_BOLD}'
-            '\nTo send a test request:\t\t'
-            f'{backend_utils.BOLD}curl {endpoint}'
-            f'{backend_utils.RESET_BOLD}'
-            '\n'
-            f'\n{fore.GREEN}SkyServe is spinning up your service now.'
-            f'{style.RESET_ALL}'
-            f'\n{fore.GREEN}The replicas should be ready within a '
-            f'short time.{style.RESET_ALL}')
+        cyan, green = colorama.Fore.CYAN, colorama.Fore.GREEN
+        bright, reset = colorama.Style.BRIGHT, colorama.Style.RESET_ALL
+        bold, reset_bold = backend_utils.BOLD, backend_utils.RESET_BOLD
+        lines = [
+            f'{cyan}Service name: {bright}{service_name}{reset}',
+            f'{cyan}Endpoint URL: {bright}{endpoint}{reset}',
+            'To see detailed info:\t\t'
+            f'{bold}sky serve status {service_name} [--endpoint]{reset_bold}',
+            'To teardown the service:\t'
+            f'{bold}sky serve down {service_name}{reset_bold}',
+            '',
+            'To see logs of a replica:\t'
+            f'{bold}sky serve logs {service_name} [REPLICA_ID]{reset_bold}',
+            'To see logs of load balancer:\t'
+            f'{bold}sky serve logs --load-balancer {service_name}{reset_bold}',
+            'To see logs of controller:\t'
+            f'{bold}sky serve logs --controller {service_name}{reset_bold}',
+            '',
+            'To monitor replica status:\t'
+            f'{bold}watch -n10 sky serve status {service_name}{reset_bold}',
+            f'To send a test request:\t\t{bold}curl {endpoint}{reset_bold}',
+            '',
+            f'{green}SkyServe is spinning up your service now.{reset}',
+            f'{green}The replicas should be ready within a short time.{reset}',
+        ]
+        sky_logging.print('\n'.join(lines))
         return service_name, endpoint
 
 
@@ -401,40 +408,46 @@ def update(
             raise ValueError(f'Failed to parse version: {version_string}; '
                              f'Returncode: {returncode}') from e
 
-    print(f'New version: {current_version}')
-    with tempfile.NamedTemporaryFile(
-            prefix=f'{service_name}-v{current_version}',
-            mode='w') as service_file:
-        task_config = task.to_yaml_config()
-        common_utils.dump_yaml(service_file.name, task_config)
-        remote_task_yaml_path = serve_utils.generate_task_yaml_file_name(
-            service_name, current_version, expand_user=False)
-
+    sky_logging.print(f'New version: {current_version}')
+    task_config = task.to_yaml_config()
+    remote_task_yaml_path = serve_utils.generate_task_yaml_file_name(
+        service_name, current_version, expand_user=False)
+    # Write the task YAML to a closed temporary file, so that its content is
+    # fully written before the upload reads it, and remove it right after the
+    # upload instead of holding it open for the rest of the update.
+    fd, service_file_path = tempfile.mkstemp(
+        prefix=f'{service_name}-v{current_version}')
+    os.close(fd)
+    try:
+        common_utils.dump_yaml(service_file_path, task_config)
         backend.sync_file_mounts(handle,
-                                 {remote_task_yaml_path: service_file.name},
+                                 {remote_task_yaml_path: service_file_path},
                                  storage_mounts=None)
+    finally:
+        os.remove(service_file_path)
+
+    code = serve_utils.ServeCodeGen.update_service(service_name,
+                                                   current_version,
+                                                   mode=mode.value)
+    returncode, _, stderr = backend.run_on_head(handle,
+                                                code,
+                                                require_outputs=True,
+                                                stream_logs=False,
+                                                separate_stderr=True)
+    try:
+        subprocess_utils.handle_returncode(returncode,
+                                           code,
+                                           'Failed to update services',
+                                           stderr,
+                                           stream_logs=True)
+    except exceptions.CommandError as e:
+        raise RuntimeError(e.error_msg) from e
 
-        code = serve_utils.ServeCodeGen.update_service(service_name,
-                                                       current_version,
-                                                       mode=mode.value)
-        returncode, _, stderr = backend.run_on_head(handle,
-                                                    code,
-                                                    require_outputs=True,
-                                                    stream_logs=False,
-                                                    separate_stderr=True)
-        try:
-            subprocess_utils.handle_returncode(returncode,
-                                               code,
-                                               'Failed to update services',
-                                               stderr,
-                                               stream_logs=True)
-        except exceptions.CommandError as e:
-            raise RuntimeError(e.error_msg) from e
-
-    print(f'{colorama.Fore.GREEN}Service {service_name!r} update scheduled.'
-          f'{colorama.Style.RESET_ALL}\n'
-          f'Please use {backend_utils.BOLD}sky serve status {service_name} '
-          f'{backend_utils.RESET_BOLD}to check the latest status.')
+    sky_logging.print(
+        f'{colorama.Fore.GREEN}Service {service_name!r} update scheduled.'
+        f'{colorama.Style.RESET_ALL}\n'
+        f'Please use {backend_utils.BOLD}sky serve status {service_name} '
+        f'{backend_utils.RESET_BOLD}to check the latest status.')
 
 
 @usage_lib.entrypoint
@@ -467,10 +480,10 @@ def down(
         controller=controller_utils.Controllers.SKY_SERVE_CONTROLLER,
         stopped_message='All services should have terminated.')
 
-    service_names_str = ','.join(service_names)
-    if sum([len(service_names) > 0, all]) != 1:
-        argument_str = f'service_names={service_names_str}' if len(
-            service_names) > 0 else ''
+    # Exactly one of service_names and all should be specified.
+    if bool(service_names) == all:
+        argument_str = (f'service_names={",".join(service_names)}'
+                        if service_names else '')
         argument_str += ' all' if all else ''
         raise ValueError('Can only specify one of service_names or all. '
                          f'Provided {argument_str!r}.')
@@ -173,7 +173,7 @@ def _get_resources_ports(task_yaml: str) -> str:
     task = sky.Task.from_yaml(task_yaml)
     # Already checked all ports are the same in sky.serve.core.up
     assert len(task.resources) >= 1, task
-    task_resources: 'resources.Resources' = list(task.resources)[0]
+    task_resources: 'resources.Resources' = next(iter(task.resources))
     # Already checked the resources have and only have one port
     # before upload the task yaml.
     assert task_resources.ports is not None
@@ -988,7 +988,7 @@ class SkyPilotReplicaManager(ReplicaManager):
                     continue
                 # Re-raise the exception if it is not preempted.
                 raise
-            job_status = list(job_statuses.values())[0]
+            job_status = next(iter(job_statuses.values()))
             if job_status in [
                     job_lib.JobStatus.FAILED, job_lib.JobStatus.FAILED_SETUP
             ]:
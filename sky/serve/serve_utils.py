@@ -520,6 +520,21 @@ def wait_service_registration(service_name: str, job_id: int) -> str:
         time.sleep(1)
 
 
+def wait_service_registration_with_job_status(service_name: str,
+                                              job_id: int) -> str:
+    """Same as wait_service_registration(), but reports the job status.
+
+    If the service fails to register, the status of the controller job is
+    printed as a payload before the error is re-raised, so that the caller
+    does not need another round-trip to the controller to fetch it.
+    """
+    try:
+        return wait_service_registration(service_name, job_id)
+    except Exception:  # pylint: disable=broad-except
+        print(job_lib.get_statuses_payload([job_id]), end='', flush=True)
+        raise
+
+
 def load_service_initialization_result(payload: str) -> int:
     return common_utils.decode_payload(payload)
 
@@ -918,8 +933,15 @@ class ServeCodeGen:
     @classmethod
     def wait_service_registration(cls, service_name: str, job_id: int) -> str:
         code = [
-            'msg = serve_utils.wait_service_registration('
-            f'{service_name!r}, {job_id})', 'print(msg, end="", flush=True)'
+            # Backward compatibility for old serve version on the remote
+            # machine. `wait_service_registration_with_job_status` was added
+            # in SERVE_VERSION 2; older versions do not report the controller
+            # job status on failure.
+            'wait_fn = serve_utils.wait_service_registration_with_job_status '
+            'if getattr(constants, "SERVE_VERSION", 0) >= 2 '
+            'else serve_utils.wait_service_registration',
+            f'msg = wait_fn({service_name!r}, {job_id})',
+            'print(msg, end="", flush=True)',
         ]
         return cls._build(code)
 
@@ -511,11 +511,40 @@ class Task:
             #  https://github.com/yaml/pyyaml/issues/165#issuecomment-430074049
             # to raise errors on duplicate keys.
             config = yaml.safe_load(f)
+        return Task._from_loaded_yaml(config, f'Path: {yaml_path}')
 
+    @staticmethod
+    def from_yaml_str(yaml_str: str) -> 'Task':
+        """Initializes a task from a task YAML string.
+
+        Example:
+            .. code-block:: python
+
+                task = sky.Task.from_yaml_str('run: echo hi')
+
+        Args:
+          yaml_str: content of a valid task yaml file.
+
+        Raises:
+          ValueError: if the content gets loaded into a str instead of a dict;
+            or if there are any other parsing errors.
+        """
+        config = yaml.safe_load(yaml_str)
+        return Task._from_loaded_yaml(config, f'Content: {yaml_str!r}')
+
+    @staticmethod
+    def _from_loaded_yaml(config: Any, source_desc: str) -> 'Task':
+        """Initializes a task from the result of yaml.safe_load().
+
+        Args:
+          config: the loaded yaml.
+          source_desc: description of where the yaml is loaded from, used in
+            the error message.
+        """
         if isinstance(config, str):
             with ux_utils.print_exception_no_traceback():
                 raise ValueError('YAML loaded as str, not as dict. '
-                                 f'Is it correct? Path: {yaml_path}')
+                                 f'Is it correct? {source_desc}')
 
         if config is None:
             config = {}
@@ -157,3 +157,26 @@ def test_replace_envs_in_workdir(tmpdir, tmp_path):
             """), tmp_path)
     task = Task.from_yaml(config_path)
     assert task.workdir == tmpdir
+
+
+def test_task_from_yaml_str():
+    task = Task.from_yaml_str(
+        textwrap.dedent("""\
+            name: task
+            run: |
+              echo hi
+            """))
+    assert task.name == 'task'
+    assert task.run == 'echo hi\n'
+
+
+def test_empty_task_from_yaml_str():
+    task = Task.from_yaml_str('')
+    assert task.name is None
+    assert task.run is None
+    assert task.num_nodes == 1
+
+
+def test_invalid_task_from_yaml_str():
+    with pytest.raises(ValueError, match='YAML loaded as str'):
+        Task.from_yaml_str('just a string')
@@ -2,10 +2,15 @@ import os
 import pathlib
 from unittest import mock
 
+import pytest
+
 from sky import clouds
+from sky import exceptions
 from sky import skypilot_config
+from sky import status_lib
 from sky.backends import backend_utils
 from sky.resources import Resources
+from sky.utils import controller_utils
 
 
 # Set env var to test config file.
@@ -118,3 +123,34 @@ def test_write_cluster_config_w_remote_identity(mock_fill_template,
             "config template incorrect")
     assert (mock_fill_template.call_args[0][1].items() >=
             expected_subset.items(), "config fill values incorrect")
+
+
+@mock.patch.object(backend_utils, '_controller_last_accessible_time', {})
+@mock.patch('sky.global_user_state.get_cluster_from_name')
+@mock.patch('sky.backends.backend_utils.refresh_cluster_status_handle')
+def test_is_controller_accessible_cache(mock_refresh, mock_get_cluster) -> None:
+    handle = mock.MagicMock(head_ip='1.2.3.4')
+    mock_refresh.return_value = (status_lib.ClusterStatus.UP, handle)
+    mock_get_cluster.return_value = {
+        'status': status_lib.ClusterStatus.UP,
+        'handle': handle,
+    }
+    controller = controller_utils.Controllers.SKY_SERVE_CONTROLLER
+
+    # The second call within the cache duration skips the status refresh.
+    assert backend_utils.is_controller_accessible(
+        controller=controller, stopped_message='stopped') is handle
+    assert backend_utils.is_controller_accessible(
+        controller=controller, stopped_message='stopped') is handle
+    assert mock_refresh.call_count == 1
+
+    # The cache is bypassed once the controller is no longer UP locally.
+    mock_get_cluster.return_value = {
+        'status': status_lib.ClusterStatus.STOPPED,
+        'handle': handle,
+    }
+    mock_refresh.return_value = (status_lib.ClusterStatus.STOPPED, handle)
+    with pytest.raises(exceptions.ClusterNotUpError):
+        backend_utils.is_controller_accessible(controller=controller,
+                                               stopped_message='stopped')
+    assert mock_refresh.call_count == 2
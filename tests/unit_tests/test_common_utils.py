@@ -49,3 +49,50 @@ class TestMakeClusterNameOnCloud:
         mock_get_user_hash.return_value = MOCKED_USER_HASH
         assert "cuda-11-8-ab12" == common_utils.make_cluster_name_on_cloud(
             "Cuda_11.8")
+
+
+class TestDumpYaml:
+
+    def test_dump_and_read_dict(self, tmp_path):
+        config = {
+            'name': 'service',
+            'resources': {
+                'ports': '8080',
+                'cpus': '2+',
+            },
+            'envs': {
+                'EMPTY': '',
+                'NUMBER_LIKE': '123',
+            },
+            'run': 'echo hi\nsleep 10 && echo "done"\n',
+            'file_mounts': {},
+        }
+        path = str(tmp_path / 'config.yaml')
+        common_utils.dump_yaml(path, config)
+        loaded = common_utils.read_yaml(path)
+        assert loaded == config
+        # Port strings must stay strings rather than being loaded as ints.
+        assert loaded['resources']['ports'] == '8080'
+        # Key order is preserved.
+        assert list(loaded.keys()) == list(config.keys())
+
+    def test_dump_and_read_list(self, tmp_path):
+        configs = [
+            {
+                'name': 'pipeline'
+            },
+            {
+                'name': 'task-1',
+                'run': 'echo task 1\necho done\n',
+                'resources': {
+                    'ports': ['8080', '30001-30020'],
+                },
+            },
+            {
+                'name': 'task-2',
+                'num_nodes': 2,
+            },
+        ]
+        path = str(tmp_path / 'dag.yaml')
+        common_utils.dump_yaml(path, configs)
+        assert common_utils.read_yaml_all(path) == configs
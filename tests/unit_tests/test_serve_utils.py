@@ -0,0 +1,50 @@
+import sqlite3
+from unittest import mock
+
+import pytest
+
+from sky.serve import serve_utils
+from sky.skylet import job_lib
+from sky.utils import common_utils
+
+
+@pytest.fixture
+def mock_jobs_cursor():
+    conn = sqlite3.connect(':memory:')
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE jobs (job_id INTEGER, status TEXT)')
+    cursor.execute('INSERT INTO jobs VALUES (?, ?)',
+                   (3, job_lib.JobStatus.PENDING.value))
+    with mock.patch.object(job_lib, '_CURSOR', cursor):
+        yield
+    conn.close()
+
+
+@pytest.mark.usefixtures('mock_jobs_cursor')
+def test_wait_service_registration_with_job_status_success(capsys):
+    with mock.patch.object(serve_utils,
+                           'wait_service_registration',
+                           return_value=common_utils.encode_payload(30001)):
+        payload = serve_utils.wait_service_registration_with_job_status(
+            'test-service', 3)
+    assert serve_utils.load_service_initialization_result(payload) == 30001
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.usefixtures('mock_jobs_cursor')
+def test_wait_service_registration_with_job_status_failure(capsys):
+    with mock.patch.object(serve_utils,
+                           'wait_service_registration',
+                           side_effect=RuntimeError('Max number of services '
+                                                    'reached.')):
+        with pytest.raises(RuntimeError, match='Max number of services'):
+            serve_utils.wait_service_registration_with_job_status(
+                'test-service', 3)
+    statuses = job_lib.load_statuses_payload(capsys.readouterr().out)
+    assert statuses == {3: job_lib.JobStatus.PENDING}
+
+
+def test_wait_service_registration_codegen_gated_on_serve_version():
+    code = serve_utils.ServeCodeGen.wait_service_registration('test-service', 3)
+    assert 'wait_service_registration_with_job_status' in code
+    assert 'getattr(constants, "SERVE_VERSION", 0) >= 2' in code